@@ -5,7 +5,7 @@
 # This script is executed by shell2http. It clones a Git repository
 # and runs a command inside it.
 #
-# WARNING: This script uses `eval` to execute the command provided in the
+# WARNING: This script uses `bash -c` to execute the command provided in the
 # `test_cmd` variable. The endpoint is intended to be run in a sandboxed
 # environment and accessed only by trusted agents like Jules. Exposing this
 # endpoint to the public internet without a strong authentication layer is
@@ -15,6 +15,8 @@
 #   - repo: The full URL of the git repository to clone.
 #   - branch: The branch of the repository to check out.
 #   - test_cmd: The shell command to execute in the repository root.
+#   - timeout_secs (optional): A total time budget, in seconds, shared by the
+#     clone and the command. Once it is spent the run is aborted.
 
 # --- Script Configuration ---
 
@@ -34,6 +36,39 @@ if [ -z "${repo:-}" ] || [ -z "${branch:-}" ] || [ -z "${test_cmd:-}" ]; then
   exit 1
 fi
 
+# Validate the optional time budget.
+timeout_secs="${timeout_secs:-}"
+if [ -n "$timeout_secs" ]; then
+  if ! [[ "$timeout_secs" =~ ^[1-9][0-9]*$ ]]; then
+    echo "[ERROR] 'timeout_secs' must be a positive whole number of seconds." >&2
+    exit 1
+  fi
+  if ! command -v timeout &> /dev/null; then
+    echo "[WARN] 'timeout' is not available on this machine; ignoring 'timeout_secs'." >&2
+    timeout_secs=""
+  fi
+fi
+
+# Run a command within whatever is left of the time budget, if one was given.
+# `timeout` exits with status 124 when the budget runs out.
+run_within_budget() {
+  if [ -z "$timeout_secs" ]; then
+    "$@"
+    return
+  fi
+  local remaining=$((timeout_secs - SECONDS))
+  if [ "$remaining" -le 0 ]; then
+    echo "[ERROR] Time budget of ${timeout_secs}s exhausted." >&2
+    return 124
+  fi
+  local status=0
+  timeout "$remaining" "$@" || status=$?
+  if [ "$status" -eq 124 ]; then
+    echo "[ERROR] Time budget of ${timeout_secs}s exhausted." >&2
+  fi
+  return "$status"
+}
+
 # --- Execution ---
 
 # Create a temporary directory for the test run.
@@ -48,8 +83,9 @@ echo "[INFO] Created temporary directory at: $TMP_DIR"
 cd "$TMP_DIR"
 
 echo "[INFO] Cloning repository: $repo (branch: $branch)"
-# Clone a specific branch with a depth of 1 for efficiency.
-git clone --depth 1 -b "$branch" "$repo" "repo"
+# Clone a specific branch with a depth of 1 for efficiency, skipping tags
+# since only the checked-out tree is needed.
+run_within_budget git clone --depth 1 --no-tags -b "$branch" "$repo" "repo"
 cd "repo"
 
 echo "[INFO] Repository cloned. Current working directory: $(pwd)"
@@ -59,7 +95,10 @@ echo "[INFO] ---"
 
 # Execute the provided command.
 # The output of this command will be the main body of the HTTP response.
-eval "$test_cmd"
+# It always runs in its own strict child shell, with or without a time budget,
+# so it sees the same environment either way. `timeout` also needs a program
+# to run.
+run_within_budget bash -euo pipefail -c "$test_cmd"
 
 echo "[INFO] ---"
 echo "[INFO] Command finished with exit code $?."
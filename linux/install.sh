@@ -17,6 +17,7 @@ AGENT_RUNNER_SCRIPT="$AGENT_CONFIG_DIR/runner.sh"
 AGENT_CRED_FILE="$AGENT_CONFIG_DIR/credentials"
 SERVICE_NAME="jules-endpoint"
 PORT="8080" # Local port for shell2http
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)" # Resolved before we cd into the temp dir
 
 # --- Helper Functions ---
 info() {
@@ -90,18 +91,28 @@ TMP_DIR=$(mktemp -d)
 trap 'rm -rf -- "$TMP_DIR"' EXIT
 cd "$TMP_DIR"
 
-# Download and install shell2http
-info "Downloading shell2http v$SHELL2HTTP_VERSION..."
+# Download shell2http and cloudflared in parallel, since neither depends on the other
 S2H_URL="https://github.com/msoap/shell2http/releases/download/$SHELL2HTTP_VERSION/shell2http-$SHELL2HTTP_VERSION.$OS'_'$ARCH.tar.gz"
-curl -sL "$S2H_URL" | tar -xz
+CF_URL="https://github.com/cloudflare/cloudflared/releases/latest/download/cloudflared-$OS-$ARCH"
+
+info "Downloading shell2http v$SHELL2HTTP_VERSION and cloudflared..."
+curl -sL "$S2H_URL" | tar -xz &
+S2H_PID=$!
+curl -sL -o cloudflared "$CF_URL" &
+CF_PID=$!
+
+# Both downloads land in the temp dir, so nothing in /usr/local/bin is touched
+# until both have succeeded.
+wait "$S2H_PID" || error "Failed to download shell2http."
+wait "$CF_PID" || error "Failed to download cloudflared."
+
+# Install shell2http
 mv shell2http /usr/local/bin/shell2http
 chmod +x /usr/local/bin/shell2http
 info "shell2http installed successfully."
 
-# Download and install cloudflared
-info "Downloading cloudflared..."
-CF_URL="https://github.com/cloudflare/cloudflared/releases/latest/download/cloudflared-$OS-$ARCH"
-curl -sL -o /usr/local/bin/cloudflared "$CF_URL"
+# Install cloudflared
+mv cloudflared /usr/local/bin/cloudflared
 chmod +x /usr/local/bin/cloudflared
 info "cloudflared installed successfully."
 
@@ -112,14 +123,17 @@ mkdir -p "$AGENT_CONFIG_DIR"
 
 # Create credentials file
 info "Storing credentials securely."
-echo "JULES_USERNAME=$JULES_USERNAME" > "$AGENT_CRED_FILE"
-echo "JULES_PASSWORD=$JULES_PASSWORD" >> "$AGENT_CRED_FILE"
+# Write both lines in one redirection, and create the file owner-only from the
+# start so the password is never briefly readable by other users.
+(
+    umask 077
+    printf 'JULES_USERNAME=%s\nJULES_PASSWORD=%s\n' "$JULES_USERNAME" "$JULES_PASSWORD" > "$AGENT_CRED_FILE"
+)
 chmod 600 "$AGENT_CRED_FILE"
 
-# Copy the runner.sh script from the common directory
+# Copy the runner.sh script from the common directory, setting its mode in the same step
 info "Installing runner script to $AGENT_RUNNER_SCRIPT"
-cp ../common/runner.sh "$AGENT_RUNNER_SCRIPT"
-chmod +x "$AGENT_RUNNER_SCRIPT"
+install -m 0755 "$SCRIPT_DIR/../common/runner.sh" "$AGENT_RUNNER_SCRIPT"
 
 # 6. Set up System Service
 info "Setting up systemd service for Linux..."
@@ -146,8 +160,7 @@ Restart=on-failure
 WantedBy=multi-user.target
 EOF
 systemctl daemon-reload
-systemctl enable "$SERVICE_NAME"
-systemctl start "$SERVICE_NAME"
+systemctl enable --now "$SERVICE_NAME"
 info "$SERVICE_NAME service started and enabled."
 
 # 7. Configure Cloudflare Tunnel
@@ -165,7 +178,8 @@ info "Creating a new tunnel named: $TUNNEL_NAME"
 if ! cloudflared tunnel create "$TUNNEL_NAME"; then
     error "Failed to create Cloudflare tunnel. Please check your Cloudflare account and try again."
 fi
-TUNNEL_UUID=$(cloudflared tunnel list | grep "$TUNNEL_NAME" | awk '{print $1}')
+# Match the NAME column exactly in one awk pass rather than grep | awk.
+TUNNEL_UUID=$(cloudflared tunnel list | awk -v name="$TUNNEL_NAME" '$2 == name { print $1 }')
 
 info "Configuring the tunnel to point to the local service..."
 CF_CONFIG_DIR="/etc/cloudflared"
@@ -63,6 +63,11 @@ Write-Info "Installation directory will be: $InstallDir"
 New-Item -ItemType Directory -Path $InstallDir -Force
 $TempDir = New-Item -ItemType Directory -Path (Join-Path $env:TEMP "jules-install-$(Get-Random)")
 
+# Invoke-WebRequest redraws its progress bar for every chunk it receives, which
+# slows large downloads dramatically. Silence it for the downloads only.
+$OriginalProgressPreference = $ProgressPreference
+$ProgressPreference = 'SilentlyContinue'
+
 try {
     Write-Info "Downloading shell2http..."
     $S2H_URL = "https://github.com/msoap/shell2http/releases/download/1.17.0/shell2http-1.17.0.windows_$($Arch).zip"
@@ -76,6 +81,7 @@ try {
     Write-Info "Binaries installed successfully."
 }
 finally {
+    $ProgressPreference = $OriginalProgressPreference
     Remove-Item -Recurse -Force -Path $TempDir
 }
 
@@ -93,7 +99,7 @@ try {
     Write-Host "[INFO] Created temp dir: $($tempDir.FullName)"
     Set-Location -Path $tempDir.FullName
     Write-Host "[INFO] Cloning: $env:repo (branch: $env:branch)"
-    git clone --depth 1 -b $env:branch $env:repo "repo"
+    git clone --depth 1 --no-tags -b $env:branch $env:repo "repo"
     Set-Location -Path (Join-Path $tempDir.FullName "repo")
     Write-Host "[INFO] Executing: $env:test_cmd"
     try {
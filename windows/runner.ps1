@@ -36,8 +36,9 @@ try {
     Set-Location -Path $tempDir.FullName
 
     Write-Host "[INFO] Cloning repository: $env:repo (branch: $env:branch)"
-    # Clone a specific branch with a depth of 1 for efficiency.
-    git clone --depth 1 -b $env:branch $env:repo "repo"
+    # Clone a specific branch with a depth of 1 for efficiency, skipping tags
+    # since only the checked-out tree is needed.
+    git clone --depth 1 --no-tags -b $env:branch $env:repo "repo"
     Set-Location -Path (Join-Path $tempDir.FullName "repo")
 
     Write-Host "[INFO] Repository cloned. Current working directory: $(Get-Location)"